@@ -1,6 +1,6 @@
 from .eseries import (ESeries, E3, E6, E12, E24, E48, E96, E192, series, series_keys, tolerance,
                       find_greater_than_or_equal, find_greater_than, find_less_than_or_equal, find_less_than,
-                      find_nearest, find_nearest_few, erange, open_erange)
+                      find_nearest, find_nearest_few, erange, erange_array, open_erange)
 
 __all__ = [
     'ESeries',
@@ -21,5 +21,6 @@ __all__ = [
     'find_nearest',
     'find_nearest_few',
     'erange',
+    'erange_array',
     'open_erange',
 ]
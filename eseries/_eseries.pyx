@@ -0,0 +1,38 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Optional C accelerator for the eseries range engine.
+
+The arithmetic here mirrors the pure-Python range loop exactly and is
+only valid within the decade window the caller enforces, where scaling
+by powers of ten reproduces decimal rounding bit-for-bit.
+"""
+from libc.math cimport floor
+
+import numpy as np
+
+
+def erange_array(double[::1] series_values, double start, double stop,
+                 long series_decade, long start_decade, long stop_decade,
+                 long start_index, long stop_index):
+    cdef Py_ssize_t num_values = series_values.shape[0]
+    cdef long figures = series_decade + 1
+    cdef long decade, exponent
+    cdef Py_ssize_t index, index_begin, index_end, count = 0
+    cdef double power, round_scale, significand, rounded_result
+    out = np.empty((stop_decade - start_decade + 1) * num_values, dtype=np.float64)
+    cdef double[::1] results = out
+    for decade in range(start_decade, stop_decade + 1):
+        index_begin = start_index if decade == start_decade else 0
+        index_end = stop_index if decade == stop_decade else num_values
+        power = 10.0 ** (decade - series_decade)
+        exponent = decade - figures + 1
+        round_scale = 10.0 ** (-exponent)
+        for index in range(index_begin, index_end):
+            significand = floor(series_values[index] * power * round_scale + 0.5)
+            if exponent >= 0:
+                rounded_result = significand * 10.0 ** exponent
+            else:
+                rounded_result = significand / round_scale
+            if start <= rounded_result <= stop:
+                results[count] = rounded_result
+                count += 1
+    return out[:count]
@@ -5,6 +5,13 @@ from setuptools import setup, find_packages  # Always prefer setuptools over dis
 from codecs import open  # To use a consistent encoding
 from os import path
 
+# The C accelerator is optional: source installs without Cython fall back
+# to the pure-Python (or numba) range engine.
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
 
 def read(*names, **kwargs):
     with io.open(
@@ -86,7 +93,7 @@ setup(
     # project is installed. For an analysis of "install_requires" vs pip's
     # requirements files see:
     # https://packaging.python.org/en/latest/requirements.html
-    install_requires=['docopt_subcommands'],
+    install_requires=['docopt_subcommands', 'numpy'],
 
     # List additional groups of dependencies here (e.g. development dependencies).
     # You can install these using the following syntax, for example:
@@ -94,9 +101,14 @@ setup(
     extras_require = {
         'dev': ['check-manifest', 'wheel'],
         'doc': ['sphinx', 'cartouche'],
+        'accel': ['numba', 'cython'],
         'test': ['coverage', 'hypothesis', 'pytest'],
     },
 
+    ext_modules=(cythonize(['eseries/_eseries.pyx'])
+                 if cythonize is not None and path.exists(path.join(here, 'eseries', '_eseries.pyx'))
+                 else []),
+
     # If there are data files included in your packages that need to be
     # installed, specify them here.  If using Python 2.6 or less, then these
     # have to be included in MANIFEST.in as well.
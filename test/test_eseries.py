@@ -3,9 +3,9 @@ from hypothesis import given, assume
 from hypothesis.strategies import sampled_from, floats, data, integers
 from pytest import raises
 
-from eseries import (ESeries, series, erange, find_less_than_or_equal, find_greater_than_or_equal, find_nearest,
-                     find_less_than, find_greater_than, find_nearest_few, open_erange)
-from eseries.eseries import lower_tolerance_limit, upper_tolerance_limit, tolerance_limits, E12, tolerance
+from eseries import (ESeries, series, erange, erange_array, find_less_than_or_equal, find_greater_than_or_equal,
+                     find_nearest, find_less_than, find_greater_than, find_nearest_few, open_erange)
+from eseries.eseries import lower_tolerance_limit, upper_tolerance_limit, tolerance_limits, E6, E12, tolerance
 
 
 @given(series_key=sampled_from(ESeries))
@@ -144,6 +144,14 @@ def test_tolerance_limits_bound_nominal_value(series_key, value):
     assert lower < value < upper
 
 
+def test_erange_empty_when_no_member_in_range():
+    assert list(erange(E6, 8.24, 8.24)) == []
+
+
+def test_erange_array_empty_when_no_member_in_range():
+    assert list(erange_array(E6, 8.24, 8.24)) == []
+
+
 def test_erange_start_infinite_raises_value_error():
     with raises(ValueError):
         inf = float("inf")
@@ -170,6 +178,40 @@ def test_erange_start_stop_in_wrong_order_raises_value_error():
         erange(E12, 10, 8)
 
 
+@given(series_key=sampled_from(ESeries),
+       low=floats(min_value=1e-35, max_value=1e35, allow_nan=False, allow_infinity=False))
+def test_erange_array_matches_erange(series_key, low):
+    high = low * 10.0
+    assume(math.isfinite(high))
+    assert list(erange_array(series_key, low, high)) == list(erange(series_key, low, high))
+
+
+def test_erange_array_start_infinite_raises_value_error():
+    with raises(ValueError):
+        inf = float("inf")
+        erange_array(E12, inf, 10)
+
+
+def test_erange_array_stop_infinite_raises_value_error():
+    with raises(ValueError):
+        erange_array(E12, 10, float("inf"))
+
+
+def test_erange_array_start_too_small_raises_value_error():
+    with raises(ValueError):
+        erange_array(E12, 0, 10)
+
+
+def test_erange_array_stop_too_small_raises_value_error():
+    with raises(ValueError):
+        erange_array(E12, 10, 0)
+
+
+def test_erange_array_start_stop_in_wrong_order_raises_value_error():
+    with raises(ValueError):
+        erange_array(E12, 10, 8)
+
+
 def test_open_erange_start_infinite_raises_value_error():
     with raises(ValueError):
         inf = float("inf")
@@ -196,6 +238,15 @@ def test_open_erange_start_stop_in_wrong_order_raises_value_error():
         open_erange(E12, 10, 8)
 
 
+def test_find_less_than_near_float_maximum_skips_unrepresentable_value():
+    assert find_less_than(E12, 1.7e308) == 1.5e308
+
+
+def test_find_greater_than_near_float_maximum_raises_value_error():
+    with raises(ValueError):
+        find_greater_than(E12, 1.75e308)
+
+
 def test_illegal_series_key_raises_value_error():
     with raises(ValueError):
         series(13)